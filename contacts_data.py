@@ -0,0 +1,87 @@
+# --- Sample Data for Random Name Generation (Islamic Names) ---
+# You can expand these tuples for more variety
+FIRST_NAMES = (
+    "Mohammed", "Ahmed", "Ali", "Omar", "Yusuf", "Ibrahim", "Hassan", "Hussein", "Khalid", "Mustafa",
+    "Abdullah", "Abdulrahman", "Saad", "Faisal", "Tariq", "Zayd", "Bilal", "Hamza", "Idris", "Ismail",
+    "Fatima", "Aisha", "Khadija", "Zainab", "Maryam", "Amina", "Hafsa", "Safiya", "Ruqayyah", "Sumayyah",
+    "Layla", "Noor", "Hana", "Sara", "Yasmin", "Farah", "Samira", "Nadia", "Iman", "Salma",
+    "Jamal", "Karim", "Rashid", "Malik", "Nasir", "Aziz", "Hakim", "Rafiq", "Tahir", "Waqar",
+    "Zubair", "Anwar", "Imran", "Jawad", "Naveed", "Qadir", "Salim", "Umar", "Wasim", "Yasir",
+    "Asad", "Bashir", "Dawood", "Fahad", "Ghazi", "Haroon", "Irfan", "Jameel", "Kamran", "Latif",
+    "Munir", "Nabeel", "Qasim", "Raheem", "Shahid", "Taimur", "Usama", "Waheed", "Zahir", "Adnan",
+    "Fatimah", "Ayesha", "Khadijah", "Zaynab", "Mariam", "Aminah", "Hafsah", "Safiyyah", "Ruqayyah", "Sumayya",
+    "Leila", "Nur", "Hannah", "Sarah", "Yasmeen", "Farha", "Sameera", "Nadiyah", "Imaan", "Salmah",
+    "Asiya", "Basimah", "Dalal", "Farida", "Ghada", "Halima", "Ibtisam", "Jameela", "Karima", "Lubna",
+    "Madiha", "Nabeela", "Qamra", "Rabia", "Safia", "Tahira", "Uzma", "Wafa", "Zara", "Aliyah",
+    "Bushra", "Dalia", "Fariha", "Huda", "Inaya", "Jannah", "Kenza", "Latifa", "Malika", "Nabila",
+    "Qamar", "Rania", "Sabrina", "Tala", "Umm", "Warda", "Zahra", "Amal", "Badriyah", "Dina",
+    "Amira", "Rami", "Samah", "Najib", "Samiya", "Rabab", "Munira", "Gamal", "Mona", "Rashida",
+    "Sahar", "Faris", "Yara", "Rana", "Hatem", "Lina", "Ramiya", "Nour", "Majid", "Rania",
+    "Abeer", "Sami", "Mazin", "Nada", "Salem", "Nidal", "Maysa", "Rafif", "Jad", "Sawsan",
+    "Ayman", "Hala", "Nashwa", "Tamer", "Nihal", "Ruba", "Hossam", "Amani", "Khalil", "Dina",
+    "Fadi", "Rima", "Shadi", "Maha", "Nouran", "Ola", "Heba", "Tala", "Rashed", "Siham"
+)
+MIDDLE_NAMES = (
+    "Ali", "Hassan", "Hussein", "Ahmed", "Khan", "Mohammed", "Abdul", "Din", "Uddin", "Al",
+    # Common components or names
+    "Noor", "Zahra", "Banu", "Begum", "Sultana", "Khatun",  # Female specific or common honorifics used as middle
+    "Ibn", "Bin",  # Patronymic (son of) - less common in simple name generation
+    "Bint",  # Matronymic (daughter of) - less common in simple name generation
+    "El", "Al-",  # Common prefixes
+    # Additional middle names
+    "Abid", "Adil", "Akbar", "Amir", "Anwar", "Arif", "Asif", "Azam", "Badr", "Basim",
+    "Deen", "Ehsan", "Faiz", "Fareed", "Fawaz", "Habib", "Hadi", "Hafiz", "Hakeem", "Halim",
+    "Hamid", "Haris", "Hasan", "Hashim", "Haytham", "Hikmat", "Hisham", "Ihsan", "Imad", "Isa",
+    "Jabbar", "Jalal", "Jamal", "Jamil", "Jawad", "Jibril", "Kamal", "Kareem", "Khalil", "Latif",
+    "Mahdi", "Mahmoud", "Majid", "Mansoor", "Marwan", "Mubarak", "Mubin", "Mumtaz", "Munir", "Musa",
+    "Naeem", "Nasir", "Numan", "Nur", "Qasim", "Rafiq", "Raheem", "Rashid", "Raza", "Ridwan",
+    "Sabir", "Sadiq", "Saeed", "Salah", "Saleem", "Salim", "Samad", "Sami", "Samir", "Shakir",
+    "Sharif", "Shihab", "Siddiq", "Tahir", "Talib", "Taqi", "Tariq", "Tawfiq", "Wafi", "Wajid",
+    "Waleed", "Wasim", "Yaseen", "Yasir", "Yousef", "Yusuf", "Zafar", "Zahid", "Zaid", "Zain",
+    # Female middle names
+    "Aaliyah", "Afifa", "Alima", "Amira", "Anisa", "Arwa", "Asma", "Aziza", "Bahija", "Basima",
+    "Fadila", "Faiza", "Farida", "Habiba", "Hafsa", "Hajra", "Halima", "Hamida", "Hanifa", "Hasna",
+    "Huda", "Ihsan", "Inaya", "Jamilah", "Karima", "Khalida", "Latifa", "Lubna", "Madiha", "Manal",
+    "Maryam", "Munira", "Nabila", "Nadira", "Naima", "Najma", "Nasreen", "Nawra", "Nazira", "Nusrat",
+    "Qadira", "Rabia", "Rahima", "Rashida", "Razia", "Sabira", "Sadiqa", "Safiya", "Sahar", "Saida",
+    "Sakina", "Salima", "Samira", "Shahida", "Shakira", "Shamsa", "Shirin", "Siddiqah", "Tahira", "Taliba",
+    "Tamara", "Taqwa", "Thana", "Umayma", "Wafaa", "Wahida", "Warda", "Wasima", "Yumna", "Zahira",
+    "Zahra", "Zakiya", "Zainab", "Zubaidah",
+    "Rasheed", "Haleem", "Adeel", "Sami", "Sajid", "Naseem", "Imran", "Younis", "Shahzad", "Zeeshan",
+    "Farooq", "Sadiq", "Saif", "Kareem", "Tariq", "Amin", "Rafique", "Feroz", "Waseem", "Hafiz",
+    "Riaz", "Aslam", "Sultan", "Aftab", "Rauf", "Naeem", "Waheed", "Fawad", "Shabbir", "Qadeer",
+    "Mehmood", "Rashida", "Nighat", "Shazia", "Sadia", "Lubna", "Shamim", "Mumtaz", "Nazia", "Parveen"
+)
+LAST_NAMES = (
+    "Khan", "Hussain", "Ahmed", "Ali", "Mohammed", "Syed", "Sheikh", "Malik", "Mirza", "Beg",
+    "Qureshi", "Siddiqui", "Ansari", "Farooqi", "Usmani", "Chaudhry", "Abbasi", "Jafari", "Kazmi", "Rizvi",
+    "Hassan", "Rahman", "Abdullah", "Iqbal", "Sharif", "Bakr", "Omar", "Osman", "Zaman", "Alvi",
+    "Abbas", "Abbassi", "Abidi", "Abubaker", "Abubakar", "Adil", "Afridi", "Agha", "Ahmad", "Ahmadi",
+    "Akbar", "Akbari", "Akhtar", "Akhundzada", "Alavi", "Alim", "Amiri", "Ansar", "Anwari", "Arif",
+    "Ashraf", "Askari", "Asker", "Aslam", "Awan", "Ayub", "Azad", "Azam", "Azhar", "Aziz",
+    "Azizi", "Babar", "Badri", "Bahadur", "Bahri", "Baloch", "Baluch", "Bangash", "Baqri", "Bashar",
+    "Bashir", "Bhatti", "Bukhari", "Butt", "Chishti", "Choudhary", "Daoud", "Darwish", "Dehlavi", "Durrani",
+    "Ebrahimi", "Elahi", "Emami", "Farhat", "Farid", "Farooq", "Fawzi", "Ghafoor", "Ghani", "Ghaznavi",
+    "Ghazali", "Ghouri", "Gilani", "Gul", "Habibi", "Hafeez", "Hafiz", "Hakimi", "Hamid", "Hanif",
+    "Haq", "Haroon", "Hashemi", "Hashmi", "Hassani", "Hayat", "Hayyat", "Hekmat", "Hosseini", "Humayun",
+    "Hussaini", "Ibrahim", "Idrisi", "Imam", "Isfahani", "Ismail", "Israili", "Jabbar", "Jafri", "Jalali",
+    "Jamali", "Javid", "Jawad", "Javed", "Jilani", "Junaid", "Kakar", "Kalam", "Kaleem", "Karimi",
+    "Kashani", "Kazemi", "Kazi", "Kermani", "Khalid", "Khalil", "Khatib", "Khattak", "Khawaja", "Khorasani",
+    "Khoso", "Kirmani", "Kohistani", "Kundi", "Lahori", "Lodhi", "Lodin", "Lone", "Madani", "Mahdi",
+    "Mahmood", "Mahmoud", "Mahmudi", "Majeed", "Majidi", "Makhdoom", "Maleki", "Mandvi", "Mansoor", "Mansouri",
+    "Marwat", "Masood", "Mazari", "Mirwais", "Mohammadi", "Mohsin", "Moin", "Moosavi", "Mughal", "Mukhtar",
+    "Murad", "Mushtaq", "Nabi", "Nadeem", "Naderi", "Nagi", "Najafi", "Najjar", "Naqvi", "Naseri",
+    "Nasir", "Nasseri", "Nawaz", "Niazi", "Noorani", "Noor", "Nouri", "Pashtun", "Pasha", "Patel",
+    "Qadir", "Qadri", "Qasemi", "Qazi", "Rabbani", "Raees", "Rafiq", "Rahbar", "Rahimi", "Rahim",
+    "Rahmani", "Rais", "Rajput", "Ramzi", "Rasheed", "Rashid", "Rauf", "Raza", "Rehman", "Rezaei",
+    "Riaz", "Roshani", "Roshan", "Rostami", "Sadat", "Sadeghi", "Sadeq", "Saeed", "Safavi", "Safi",
+    "Sahni", "Sajjad", "Saleh", "Salim", "Sami", "Samir", "Sarwar", "Sattar", "Sattari", "Shaikh",
+    "Shakoor", "Shams", "Sharifi", "Sherazi", "Siddiq", "Sulaimani", "Sultani", "Suri", "Tabatabai", "Taheri",
+    "Taimuri", "Talib", "Talpur", "Tamimi", "Tanvir", "Taqvi", "Tareen", "Tarin", "Tirmizi", "Turabi",
+    "Umar", "Umer", "Usama", "Wali", "Wani", "Warsi", "Wazir", "Yacoub", "Yaqoob", "Yasir",
+    "Yazdani", "Younus", "Yousaf", "Yousafzai", "Yousuf", "Yousufzai", "Yousufi", "Zahedi", "Zahid", "Zaidi",
+    "Zain", "Zaman", "Zamani", "Zia", "Zubair", "Zubairi",
+    "Ansar", "Barakat", "Zaman", "Rasheed", "Shah", "Qadir", "Haneef", "Naseer", "Awan", "Chishti",
+    "Dar", "Farid", "Ghani", "Hashmi", "Iqbal", "Jalil", "Khalid", "Latif", "Mahmood", "Nawaz",
+    "Osman", "Parvez", "Qamar", "Rafique", "Sadiq", "Tahir", "Usman", "Waqar", "Yasin", "Zahid"
+)
@@ -1,28 +1,66 @@
+import csv
+import importlib.util
+import math
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import random
 import re
 
-# --- Sample Data for Random Name Generation (Islamic Names) ---
-# You can expand these lists for more variety
-FIRST_NAMES = [
-    "Mohammed", "Ahmed", "Ali", "Omar", "Yusuf", "Ibrahim", "Hassan", "Hussein", "Khalid", "Mustafa",
-    "Abdullah", "Abdulrahman", "Saad", "Faisal", "Tariq", "Zayd", "Bilal", "Hamza", "Idris", "Ismail",
-    "Fatima", "Aisha", "Khadija", "Zainab", "Maryam", "Amina", "Hafsa", "Safiya", "Ruqayyah", "Sumayyah",
-    "Layla", "Noor", "Hana", "Sara", "Yasmin", "Farah", "Samira", "Nadia", "Iman", "Salma"
-]
-MIDDLE_NAMES = [  # Often, middle names are combined or are second first names, or patronymics (ibn/bint)
-    "Ali", "Hassan", "Hussein", "Ahmed", "Khan", "Mohammed", "Abdul", "Din", "Uddin", "Al",
-    # Common components or names
-    "Noor", "Zahra", "Banu", "Begum", "Sultana", "Khatun",  # Female specific or common honorifics used as middle
-    "Ibn", "Bin",  # Patronymic (son of) - less common in simple name generation
-    "Bint",  # Matronymic (daughter of) - less common in simple name generation
-    "El", "Al-"  # Common prefixes
-]
-LAST_NAMES = [
-    "Khan", "Hussain", "Ahmed", "Ali", "Mohammed", "Syed", "Sheikh", "Malik", "Mirza", "Beg",
-    "Qureshi", "Siddiqui", "Ansari", "Farooqi", "Usmani", "Chaudhry", "Abbasi", "Jafari", "Kazmi", "Rizvi",
-    "Hassan", "Rahman", "Abdullah", "Iqbal", "Sharif", "Bakr", "Omar", "Osman", "Zaman", "Alvi"
-]
+from contacts_data import FIRST_NAMES, MIDDLE_NAMES, LAST_NAMES
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; it only speeds up phone cleaning and CSV reading and writing
+    pa = pc = pacsv = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; phone numbers are cleaned with PyArrow kernels, or pandas string methods without pyarrow
+    njit = prange = None
+
+# pandas can read Excel through the Rust calamine parser when python-calamine is installed
+_HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+
+# Output CSV columns, in order
+_COLUMN_ORDER = (
+    "Name Prefix", "FirstName", "Middle Name", "Last Name",
+    "Phonetic First Name", "Phonetic Last Name", "Phone 1 - Value",
+    "Organization Name", "Organization Title", "Website 1 - Value"
+)
+
+# Rows per RecordBatch when streaming the output CSV through PyArrow
+_CSV_BATCH_SIZE = 10_000
+
+# Compiled once and shared by the pandas and PyArrow paths of _clean_phone_column
+_NON_DIGIT = re.compile(r'[^0-9]')
+# Every byte except the ASCII digits, for bytes.translate's delete argument
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+# Lookup structures derived from the name lists, built once at import
+FIRST_NAMES_SET = frozenset(FIRST_NAMES)
+# Middle names to fall back on for each first name that also appears in MIDDLE_NAMES
+_MIDDLE_EX = {f: [m for m in MIDDLE_NAMES if m != f] for f in FIRST_NAMES_SET}
+
+# Name pools as NumPy arrays so whole batches can be drawn in a single call
+_RNG = np.random.default_rng()
+_FIRST = np.array(FIRST_NAMES, dtype=object)
+_MIDDLE = np.array(MIDDLE_NAMES, dtype=object)
+_LAST = np.array(LAST_NAMES, dtype=object)
+
+# Formats one output row from (first name, middle name, last name, phone) with the constant
+# columns baked into the template. It doesn't quote fields, which is safe for cleaned phone
+# numbers and for the name pools as long as _NAMES_NEED_QUOTING is false.
+_format_row = "QTS,{0},{1},{2},{0},{2},{3},Quadrate Tech Solutions,QTS,https://quadrate.lk\n".format
+_NAMES_NEED_QUOTING = any(c in name for name in FIRST_NAMES + MIDDLE_NAMES + LAST_NAMES for c in ',"\r\n')
+
+# Number of distinct (first, middle, last) triples. By the birthday bound, a batch of n names
+# holds about n**2 / (2 * space) duplicates, so batches up to _MAX_ROWS_WITHOUT_DEDUP rows
+# expect fewer than 0.001 and skip the duplicate check.
+_NAME_SPACE = len(FIRST_NAMES) * len(MIDDLE_NAMES) * len(LAST_NAMES)
+_MAX_ROWS_WITHOUT_DEDUP = math.isqrt(2 * _NAME_SPACE // 1000)
 
 
 def generate_random_name(name_list):
@@ -32,6 +70,55 @@ def generate_random_name(name_list):
     return random.choice(name_list)
 
 
+def generate_random_names(count):
+    """
+    Draws `count` random (first, middle, last) name triples in one batch.
+
+    Args:
+        count: Number of name triples to generate
+
+    Returns:
+        Tuple of (first_names, middle_names, last_names) NumPy object arrays of length `count`
+    """
+    first_names = _RNG.choice(_FIRST, size=count)
+    middle_names = _RNG.choice(_MIDDLE, size=count)
+    last_names = _RNG.choice(_LAST, size=count)
+
+    # Avoid first name and middle name being the same, if middle name is also a common first name
+    # (a middle name equal to a drawn first name is always in FIRST_NAMES). The redraw also
+    # uses _RNG, so seeding it is enough to make the names reproducible.
+    for i in np.flatnonzero(first_names == middle_names):
+        options = _MIDDLE_EX[first_names[i]]
+        middle_names[i] = options[_RNG.integers(len(options))] if options else ""  # "" if no other options
+
+    return first_names, middle_names, last_names
+
+
+def generate_unique_random_names(count, max_attempts=10):
+    """
+    Draws `count` random name triples, redrawing duplicates in bulk until all are unique.
+
+    Args:
+        count: Number of name triples to generate
+        max_attempts: Number of draw rounds before remaining duplicates are allowed
+
+    Returns:
+        Tuple of (first_names, middle_names, last_names) NumPy object arrays of length `count`
+    """
+    first_names, middle_names, last_names = generate_random_names(count)
+    if count <= _MAX_ROWS_WITHOUT_DEDUP:
+        return first_names, middle_names, last_names
+
+    for _ in range(max_attempts - 1):
+        names = pd.DataFrame({"first": first_names, "middle": middle_names, "last": last_names}, copy=False)
+        dup_idx = np.flatnonzero(names.duplicated().to_numpy())
+        if not len(dup_idx):
+            break
+        first_names[dup_idx], middle_names[dup_idx], last_names[dup_idx] = generate_random_names(len(dup_idx))
+    # If all attempts fail, allow duplicate (very unlikely)
+    return first_names, middle_names, last_names
+
+
 def clean_phone_number(phone_number):
     """
     Cleans and formats a phone number by removing non-numeric characters,
@@ -42,22 +129,231 @@ def clean_phone_number(phone_number):
 
     Returns:
         A cleaned phone number with only digits and possibly a leading '+'
+
+    This stays in plain Python: a single short string is cleaned faster by
+    bytes.translate than by a call into a compiled kernel. Whole columns
+    should go through clean_phone_number_series instead.
     """
     if not isinstance(phone_number, str):
         # Convert to string if it's not already
         phone_number = str(phone_number)
 
-    # Keep the leading '+' if it exists
-    has_plus = phone_number.startswith('+')
+    # Remove all non-numeric characters, keeping the leading '+' if it exists
+    cleaned_number = phone_number.encode('ascii', 'ignore').translate(None, _NON_DIGIT_BYTES).decode('ascii')
+    # Slicing by the boolean gives '+' when present and '' otherwise, without a branch
+    return phone_number[:phone_number[:1] == '+'] + cleaned_number
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True, nogil=True)
+    def _clean_bytes(buf, offsets, out, out_lengths):
+        """
+        Copies the digits (and a leading '+') of each phone number in `buf` into `out`.
+
+        Phone number i occupies buf[offsets[i]:offsets[i + 1]]. Its cleaned form is written
+        to the start of the same slice of `out` and its length to out_lengths[i].
+        """
+        for i in prange(len(offsets) - 1):
+            start = offsets[i]
+            n = 0
+            for j in range(start, offsets[i + 1]):
+                c = buf[j]
+                if (48 <= c <= 57) or (c == 43 and j == start):  # '0'-'9', or '+' at index 0
+                    out[start + n] = c
+                    n += 1
+            out_lengths[i] = n
+
+
+def _clean_phone_numbers_jit(phone_numbers):
+    """Cleans a sequence of phone number strings with the _clean_bytes kernel in a single call."""
+    encoded = [p.encode('utf-8') for p in phone_numbers]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    out = np.empty_like(buf)
+    out_lengths = np.empty(len(encoded), dtype=np.int64)
+    _clean_bytes(buf, offsets, out, out_lengths)
+
+    out_bytes = out.tobytes()
+    return [out_bytes[start:start + n].decode('ascii') for start, n in zip(offsets[:-1].tolist(), out_lengths.tolist())]
+
 
-    # Remove all non-numeric characters
-    cleaned_number = re.sub(r'[^0-9]', '', phone_number)
+def _clean_phone_numbers_arrow(phone_numbers):
+    """Cleans an Arrow string array with PyArrow compute kernels, keeping the result in Arrow."""
+    has_plus = pc.starts_with(phone_numbers, '+')
+    digits = pc.replace_substring_regex(phone_numbers, pattern=_NON_DIGIT.pattern, replacement='')
+    plus, empty = pa.scalar('+', type=digits.type), pa.scalar('', type=digits.type)
+    return pc.if_else(has_plus, pc.binary_join_element_wise(plus, digits, empty), digits)
 
-    # Add back the '+' if it was there originally
-    if has_plus:
-        cleaned_number = '+' + cleaned_number
 
-    return cleaned_number
+def _clean_phone_column(phone_numbers_series):
+    """
+    Cleans a whole column of phone numbers with the fastest available backend.
+
+    Uses a Numba-compiled kernel when numba is installed, then PyArrow compute kernels when
+    pyarrow is installed, and pandas string methods otherwise.
+
+    Returns:
+        The cleaned phone numbers in input order: a PyArrow string array when cleaned with
+        PyArrow kernels (so they can go straight to the CSV writer), a list otherwise
+    """
+    # Normalize once to strings, whatever the column's dtype or how it was selected. Missing
+    # cells become empty strings, matching clean_phone_number(str(nan)).
+    s = phone_numbers_series.astype('string').fillna('')
+    if njit is not None:
+        return _clean_phone_numbers_jit(np.asarray(s, dtype=object))
+    if pc is not None:
+        return _clean_phone_numbers_arrow(pa.array(s))
+
+    has_plus = s.str.startswith('+')
+    digits = s.str.replace(_NON_DIGIT, '', regex=True)
+    cleaned = ('+' + digits).where(has_plus, digits)
+    return cleaned.tolist()
+
+
+def clean_phone_number_series(phone_numbers_series):
+    """
+    Vectorized version of clean_phone_number for a whole column of phone numbers.
+
+    Args:
+        phone_numbers_series: pandas Series containing the phone numbers to clean
+
+    Returns:
+        A list of cleaned phone numbers, in the same order as the input
+    """
+    cleaned = _clean_phone_column(phone_numbers_series)
+    return cleaned if isinstance(cleaned, list) else cleaned.to_pylist()
+
+
+def _write_csv(output_csv_path, first_names, middle_names, last_names, phone_numbers):
+    """
+    Streams the output rows to a UTF-8 CSV file without building an output DataFrame.
+
+    Uses PyArrow's C++ CSV writer, one RecordBatch of _CSV_BATCH_SIZE rows at a time, when
+    pyarrow is installed. Otherwise rows are formatted by _format_row, or by the csv module
+    if a name needs quoting.
+
+    Args:
+        output_csv_path: Path to save the generated CSV file
+        first_names, middle_names, last_names: Generated names, one per row
+        phone_numbers: Cleaned phone numbers, one per row (a list or a PyArrow string array)
+    """
+    if pacsv is None:
+        with open(output_csv_path, 'w', newline='', encoding='utf-8') as file:
+            if not _NAMES_NEED_QUOTING:
+                file.write(','.join(_COLUMN_ORDER) + '\n')
+                file.writelines(map(_format_row, first_names, middle_names, last_names, phone_numbers))
+                return
+            writer = csv.writer(file, lineterminator='\n')
+            writer.writerow(_COLUMN_ORDER)
+            writer.writerows(
+                ("QTS", first, middle, last, first, last, phone, "Quadrate Tech Solutions", "QTS", "https://quadrate.lk")
+                for first, middle, last, phone in zip(first_names, middle_names, last_names, phone_numbers)
+            )
+        return
+
+    # Convert each column to Arrow once; batches are then zero-copy slices
+    first_names, middle_names, last_names, phone_numbers = (
+        values.cast(pa.string()) if isinstance(values, pa.Array) else pa.array(values, type=pa.string())
+        for values in (first_names, middle_names, last_names, phone_numbers)
+    )
+    schema = pa.schema([(name, pa.string()) for name in _COLUMN_ORDER])
+    if _NAMES_NEED_QUOTING:
+        with pacsv.CSVWriter(output_csv_path, schema) as writer:
+            _write_batches(writer, schema, first_names, middle_names, last_names, phone_numbers)
+        return
+
+    # Arrow always quotes the header and by default every string field, so write the header
+    # here and the rows unquoted, giving the same bytes as the other writers
+    with open(output_csv_path, 'wb') as file:
+        file.write((','.join(_COLUMN_ORDER) + '\n').encode('utf-8'))
+        write_options = pacsv.WriteOptions(include_header=False, quoting_style='none')
+        with pacsv.CSVWriter(file, schema, write_options=write_options) as writer:
+            _write_batches(writer, schema, first_names, middle_names, last_names, phone_numbers)
+
+
+def _write_batches(writer, schema, first_names, middle_names, last_names, phone_numbers):
+    """Writes the output rows to a PyArrow CSVWriter, one RecordBatch of _CSV_BATCH_SIZE rows at a time."""
+    for start in range(0, len(phone_numbers), _CSV_BATCH_SIZE):
+        first = first_names.slice(start, _CSV_BATCH_SIZE)
+        last = last_names.slice(start, _CSV_BATCH_SIZE)
+        num_rows = len(first)
+        writer.write_batch(pa.record_batch([
+            pa.repeat(pa.scalar("QTS"), num_rows),
+            first,
+            middle_names.slice(start, _CSV_BATCH_SIZE),
+            last,
+            first,  # Same as generated FirstName
+            last,  # Same as generated LastName
+            phone_numbers.slice(start, _CSV_BATCH_SIZE),
+            pa.repeat(pa.scalar("Quadrate Tech Solutions"), num_rows),
+            pa.repeat(pa.scalar("QTS"), num_rows),
+            pa.repeat(pa.scalar("https://quadrate.lk"), num_rows),
+        ], schema=schema))
+
+
+def _read_excel(input_file_path, phone_column_identifier):
+    """
+    Reads the first sheet of an Excel file, parsing only the phone column when possible.
+
+    Args:
+        input_file_path: Path to the input Excel file
+        phone_column_identifier: Name or index of the column containing phone numbers
+
+    Returns:
+        Tuple of (DataFrame, whether only the phone column was read)
+    """
+    read_kwargs = {'sheet_name': 0}  # Read the first sheet
+    if _HAS_CALAMINE:
+        read_kwargs['engine'] = 'calamine'
+    if pa is not None:
+        read_kwargs['dtype_backend'] = 'pyarrow'
+
+    if isinstance(phone_column_identifier, str) or (isinstance(phone_column_identifier, int) and phone_column_identifier >= 0):
+        try:
+            return pd.read_excel(input_file_path, usecols=[phone_column_identifier], **read_kwargs), True
+        except ValueError as e:
+            # Only a missing column is retried, reading the whole sheet so the available columns
+            # can be reported; other errors (e.g. not an Excel file) would just fail again
+            if 'usecols' not in str(e).lower():
+                raise
+
+    return pd.read_excel(input_file_path, **read_kwargs), False
+
+
+def _read_csv(input_file_path, phone_column_identifier):
+    """
+    Reads a CSV file with PyArrow's multi-threaded parser when available, parsing only the phone column.
+
+    Args:
+        input_file_path: Path to the input CSV file
+        phone_column_identifier: Name or index of the column containing phone numbers
+
+    Returns:
+        Tuple of (DataFrame, whether only the phone column was read)
+    """
+    if pa is None:
+        return pd.read_csv(input_file_path), False
+
+    read_kwargs = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+    usecols = None
+    if isinstance(phone_column_identifier, str):
+        usecols = [phone_column_identifier]
+    elif isinstance(phone_column_identifier, int) and phone_column_identifier >= 0:
+        # The pyarrow engine selects columns by name, so resolve the index from the header row
+        header = pd.read_csv(input_file_path, nrows=0).columns
+        if phone_column_identifier < len(header):
+            usecols = [header[phone_column_identifier]]
+
+    if usecols is not None:
+        try:
+            return pd.read_csv(input_file_path, usecols=usecols, **read_kwargs), True
+        except (KeyError, ValueError):
+            # The column doesn't exist; read the whole file so the available columns can be reported
+            pass
+
+    return pd.read_csv(input_file_path, **read_kwargs), False
 
 
 def convert_excel_to_custom_csv(input_file_path, phone_column_identifier, output_csv_path):
@@ -72,15 +368,16 @@ def convert_excel_to_custom_csv(input_file_path, phone_column_identifier, output
     try:
         # Try reading as Excel first
         df_input = None
+        phone_column_only = False
         try:
-            df_input = pd.read_excel(input_file_path, sheet_name=0)  # Read the first sheet
+            df_input, phone_column_only = _read_excel(input_file_path, phone_column_identifier)
             print(f"Successfully read '{input_file_path}' as an Excel file.")
         except Exception as e_excel:
             print(f"Could not read '{input_file_path}' as Excel: {e_excel}")
             # If Excel read fails, try reading as CSV, especially if the extension suggests it
             if input_file_path.lower().endswith('.csv'):
                 try:
-                    df_input = pd.read_csv(input_file_path)
+                    df_input, phone_column_only = _read_csv(input_file_path, phone_column_identifier)
                     print(f"Successfully read '{input_file_path}' as a CSV file.")
                 except Exception as e_csv:
                     print(f"Also could not read '{input_file_path}' as CSV: {e_csv}")
@@ -93,6 +390,10 @@ def convert_excel_to_custom_csv(input_file_path, phone_column_identifier, output
             print(f"Failed to read the input file: {input_file_path}")
             return
 
+        if phone_column_only and isinstance(phone_column_identifier, int):
+            # Only the requested column was parsed, so it is now the first one
+            phone_column_identifier = 0
+
         # Extract phone numbers
         phone_numbers_series = None
         if isinstance(phone_column_identifier, str):  # If column name is provided
@@ -112,59 +413,20 @@ def convert_excel_to_custom_csv(input_file_path, phone_column_identifier, output
             print("Error: 'phone_column_identifier' must be a string (column name) or an integer (column index).")
             return
 
-        output_data_rows = []
-
-        for phone_number in phone_numbers_series:
-            # Clean the phone number to ensure it contains only digits (and possibly a leading '+')
-            cleaned_phone_number = clean_phone_number(phone_number)
-
-            first_name = generate_random_name(FIRST_NAMES)
-            middle_name = generate_random_name(MIDDLE_NAMES)
-            last_name = generate_random_name(LAST_NAMES)
-
-            # Avoid first name and middle name being the same, if middle name is also a common first name
-            if first_name == middle_name and middle_name in FIRST_NAMES:
-                temp_middle_names = [m for m in MIDDLE_NAMES if m != first_name]
-                if temp_middle_names:  # if there are other options
-                    middle_name = generate_random_name(temp_middle_names)
-                else:  # if all middle names are the same as first_name (unlikely with current lists)
-                    middle_name = ""  # or some default
-
-            row = {
-                "Name Prefix": "QTS",
-                "FirstName": first_name,
-                "Middle Name": middle_name,
-                "Last Name": last_name,
-                "Phonetic First Name": first_name,  # Same as generated FirstName
-                "Phonetic Last Name": last_name,  # Same as generated LastName
-                "Phone 1 - Value": cleaned_phone_number,
-                "Organization Name": "Quadrate Tech Solutions",
-                "Organization Title": "QTS",
-                "Website 1 - Value": "https://quadrate.lk"
-            }
-            output_data_rows.append(row)
-
-        if not output_data_rows:
+        # Generate unique names on a worker thread while the main thread cleans the phone numbers
+        # to ensure they contain only digits (and possibly a leading '+'). The two are independent,
+        # and the Numba cleaning kernel releases the GIL so they can overlap.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            names_future = executor.submit(generate_unique_random_names, len(phone_numbers_series))
+            cleaned_phone_numbers = _clean_phone_column(phone_numbers_series)
+            first_names, middle_names, last_names = names_future.result()
+
+        if len(cleaned_phone_numbers) == 0:
+            # An empty CSV with headers is still written
             print("No data processed. The phone number column might be empty or the input file is empty.")
-            # Create an empty CSV with headers if no data rows
-            df_output = pd.DataFrame(columns=[
-                "Name Prefix", "FirstName", "Middle Name", "Last Name",
-                "Phonetic First Name", "Phonetic Last Name", "Phone 1 - Value",
-                "Organization Name", "Organization Title", "Website 1 - Value"
-            ])
-        else:
-            df_output = pd.DataFrame(output_data_rows)
-
-        # Ensure the column order is as requested
-        column_order = [
-            "Name Prefix", "FirstName", "Middle Name", "Last Name",
-            "Phonetic First Name", "Phonetic Last Name", "Phone 1 - Value",
-            "Organization Name", "Organization Title", "Website 1 - Value"
-        ]
-        df_output = df_output[column_order]
-
-        # Save the output DataFrame to a CSV file
-        df_output.to_csv(output_csv_path, index=False, encoding='utf-8')
+
+        # Save the rows to a CSV file
+        _write_csv(output_csv_path, first_names, middle_names, last_names, cleaned_phone_numbers)
         print(f"Successfully converted and saved data to '{output_csv_path}'")
 
     except FileNotFoundError:
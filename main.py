@@ -6,7 +6,7 @@ This script converts HL7 ADT messages to JSON format using the hl7conv2 library.
 It can process individual messages or extract multiple messages from markdown files.
 
 Usage:
-    python hl7_to_json_converter.py [input_file] [output_file]
+    python hl7_to_json_converter.py [--verbose] [input_file ...] [output_file]
 
     Or run without arguments to launch the GUI.
 """
@@ -14,24 +14,135 @@ Usage:
 import os
 import sys
 import json
-import re
+import hashlib
+import mmap
+import pickle
 import warnings
-from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, tee
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 from hl7conv2 import Hl7Json
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QLabel, QFileDialog, 
                             QTextEdit, QMessageBox, QGroupBox, QGridLayout)
 from PyQt6.QtCore import Qt
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard json module is used without it
+    orjson = None
+
 # Suppress the sipPyTypeDict deprecation warning
 warnings.filterwarnings("ignore", message=".*sipPyTypeDict.*")
 
+# HL7 messages in the markdown input are enclosed in triple backticks
+_FENCE_OPEN = '```\n'
+_FENCE_CLOSE = '\n```'
+_FENCE_OPEN_BYTES = _FENCE_OPEN.encode()
+_FENCE_CLOSE_BYTES = _FENCE_CLOSE.encode()
+
+# Converting a message takes well under a millisecond, so worker processes only pay off
+# for batches big enough to amortize starting them
+_PARALLEL_MIN_MESSAGES = 2000
+
+# Failed results identify their message by hash and this many leading characters,
+# unless the full message is requested
+_ORIGINAL_PREFIX_LENGTH = 200
+
+
+def _iter_fenced_blocks(content: Union[str, bytes, mmap.mmap], fence_open: Union[str, bytes] = _FENCE_OPEN,
+                        fence_close: Union[str, bytes] = _FENCE_CLOSE) -> Iterator[Union[str, bytes]]:
+    """
+    Yield the text of every fenced block in content, found with a single linear scan.
+
+    Matches exactly what the regex r'```\n(.*?)\n```' (with re.DOTALL) finds, but never
+    backtracks, so unclosed fences can't make the search quadratic. content can be a str,
+    or bytes or an mmap when given the byte versions of the fences.
+    """
+    pos = 0
+    while True:
+        start = content.find(fence_open, pos)
+        if start == -1:
+            return
+        start += len(fence_open)
+        end = content.find(fence_close, start)
+        if end == -1:
+            # No later fence can be closed either
+            return
+        yield content[start:end]
+        pos = end + len(fence_close)
+
+
+@lru_cache(maxsize=2048)
+def _convert_hl7_to_pickle(hl7_message: str) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Convert a single HL7 message, memoized on the message text.
+
+    Repeated messages (common in test fixtures) skip parsing. The JSON object is cached
+    pickled, so every caller unpickles a fresh copy and can't mutate the cached one.
+    """
+    json_data, error = _convert_hl7_to_json_uncached(hl7_message)
+    if json_data is None:
+        return None, error
+    return pickle.dumps(json_data, pickle.HIGHEST_PROTOCOL), error
+
+
+def convert_hl7_to_json(hl7_message: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Convert a single HL7 message to JSON format, extracting only OBX segments.
+
+    Args:
+        hl7_message: HL7 message string
+
+    Returns:
+        Tuple of (JSON object with only OBX segments or None, error message or None)
+    """
+    frozen, error = _convert_hl7_to_pickle(hl7_message)
+    if frozen is None:
+        return None, error
+    return pickle.loads(frozen), error
+
+
+def _convert_hl7_to_json_uncached(hl7_message: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parse an HL7 message with hl7conv2 and keep only its OBX segments."""
+    try:
+        # hl7conv2 builds a dict for every segment, but each segment's dict depends only on
+        # its own text, so split the segments once and hand it just the OBX ones
+        # (hl7conv2 splits segments on '\r\n', '\r' and '\n' alike)
+        segments = hl7_message.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        obx_lines = [segment for segment in segments if segment == "OBX" or segment.startswith("OBX|")]
+        if not obx_lines:
+            return {"OBX_segments": []}, None
+
+        # Use hl7conv2 to convert the message
+        hl7_obj = Hl7Json('\r'.join(obx_lines))
+        full_json_data = hl7_obj.hl7_json
+
+        # Extract only OBX segments
+        obx_segments = []
+
+        # The hl7conv2 library returns a list of segments
+        for segment in full_json_data:
+            # Check if this is an OBX segment
+            if segment.get("segment_name") == "OBX":
+                obx_segments.append(segment)
+
+        # Create a new JSON object with only OBX segments
+        obx_json_data = {
+            "OBX_segments": obx_segments
+        }
+
+        return obx_json_data, None
+    except Exception as e:
+        return None, str(e)
+
 
 class HL7Converter:
     """Class to handle conversion of HL7 messages to JSON format"""
 
     @staticmethod
-    def extract_hl7_messages_from_markdown(file_path: str) -> List[str]:
+    def extract_hl7_messages_from_markdown(file_path: str) -> Iterator[str]:
         """
         Extract HL7 messages from a markdown file.
 
@@ -39,59 +150,71 @@ class HL7Converter:
             file_path: Path to the markdown file containing HL7 messages
 
         Returns:
-            List of extracted HL7 messages as strings
+            Iterator over the extracted HL7 messages as strings, produced lazily
         """
-        with open(file_path, 'r') as file:
+        # Scan the file's pages in place and decode only the fenced blocks. Files containing
+        # '\r' are read in text mode instead, whose newline translation the fences rely on.
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                if content.find(b'\r') == -1:
+                    # Find all HL7 messages enclosed in triple backticks
+                    for block in _iter_fenced_blocks(content, _FENCE_OPEN_BYTES, _FENCE_CLOSE_BYTES):
+                        yield block.decode('utf-8')
+                    return
+
+        with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
 
         # Find all HL7 messages enclosed in triple backticks
-        pattern = r'```\n(.*?)\n```'
-        messages = re.findall(pattern, content, re.DOTALL)
+        yield from _iter_fenced_blocks(content)
 
-        return messages
+    # Module-level function so ProcessPoolExecutor can send it to worker processes
+    convert_hl7_to_json = staticmethod(convert_hl7_to_json)
 
     @staticmethod
-    def convert_hl7_to_json(hl7_message: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    def convert_messages(messages: Iterable[str]) -> Iterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
         """
-        Convert a single HL7 message to JSON format, extracting only OBX segments.
+        Convert a stream of HL7 messages, spreading large batches over worker processes.
 
         Args:
-            hl7_message: HL7 message string
+            messages: HL7 message strings
 
         Returns:
-            Tuple of (JSON object with only OBX segments or None, error message or None)
+            Iterator of (JSON object or None, error message or None) tuples, one per message
         """
-        try:
-            # Use hl7conv2 to convert the message
-            hl7_obj = Hl7Json(hl7_message)
-            full_json_data = hl7_obj.hl7_json
-
-            # Extract only OBX segments
-            obx_segments = []
-
-            # The hl7conv2 library returns a list of segments
-            for segment in full_json_data:
-                # Check if this is an OBX segment
-                if segment.get("segment_name") == "OBX":
-                    obx_segments.append(segment)
-
-            # Create a new JSON object with only OBX segments
-            obx_json_data = {
-                "OBX_segments": obx_segments
-            }
+        messages = iter(messages)
+        head = list(islice(messages, _PARALLEL_MIN_MESSAGES))
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(head) < _PARALLEL_MIN_MESSAGES:
+            yield from map(convert_hl7_to_json, chain(head, messages))
+            return
 
-            return obx_json_data, None
-        except Exception as e:
-            return None, str(e)
+        # Executor.map submits everything it is given up front, so feed it windows of
+        # _PARALLEL_MIN_MESSAGES messages. The next window is submitted before the current
+        # one is yielded, keeping the workers busy with at most two windows in memory.
+        chunksize = max(1, _PARALLEL_MIN_MESSAGES // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = executor.map(convert_hl7_to_json, head, chunksize=chunksize)
+            while True:
+                window = list(islice(messages, _PARALLEL_MIN_MESSAGES))
+                upcoming = executor.map(convert_hl7_to_json, window, chunksize=chunksize) if window else None
+                yield from pending
+                if upcoming is None:
+                    return
+                pending = upcoming
 
     @staticmethod
-    def process_file(input_file: str, output_file: str) -> Tuple[int, int]:
+    def process_file(input_file: str, output_file: str, include_original: bool = False) -> Tuple[int, int]:
         """
         Process a markdown file containing HL7 messages and convert them to JSON.
 
         Args:
             input_file: Path to the input markdown file
             output_file: Path to the output JSON file
+            include_original: Store the full message in failed results, instead of its
+                SHA-1 and first characters
 
         Returns:
             Tuple of (number of successful conversions, number of failed conversions)
@@ -104,35 +227,102 @@ class HL7Converter:
         results = []
 
         # Process each message
-        for i, message in enumerate(messages):
-            json_data, error = HL7Converter.convert_hl7_to_json(message)
-
+        # The messages are needed again for failed results, so tee the stream
+        messages, to_convert = tee(messages)
+        outcomes = HL7Converter.convert_messages(to_convert)
+        for i, (message, (json_data, error)) in enumerate(zip(messages, outcomes)):
+            results.append(HL7Converter._build_result(i + 1, message, json_data, error, include_original))
             if json_data:
-                # Add metadata to help identify the message
-                result = {
-                    "message_index": i + 1,
-                    "conversion_status": "success",
-                    "data": json_data
-                }
-                results.append(result)
                 successful += 1
             else:
-                # Include error information for failed conversions
-                result = {
-                    "message_index": i + 1,
-                    "conversion_status": "failed",
-                    "error": error,
-                    "original_message": message
-                }
-                results.append(result)
                 failed += 1
 
         # Write the results to the output file
-        with open(output_file, 'w') as file:
-            json.dump(results, file, indent=2)
+        HL7Converter._write_json(results, output_file)
+
+        return successful, failed
+
+    @staticmethod
+    def process_files(input_files: List[str], output_file: str, include_original: bool = False) -> Tuple[int, int]:
+        """
+        Process several markdown files containing HL7 messages into one JSON file.
+
+        The messages of all files are converted as a single stream, so large inputs share
+        one pool of worker processes. The output holds one result array per input file.
+
+        Args:
+            input_files: Paths to the input markdown files
+            output_file: Path to the output JSON file
+            include_original: Store the full message in failed results, instead of its
+                SHA-1 and first characters
+
+        Returns:
+            Tuple of (number of successful conversions, number of failed conversions)
+        """
+        # Tag every message with the index of the file it came from
+        tagged = (
+            (file_index, message)
+            for file_index, input_file in enumerate(input_files)
+            for message in HL7Converter.extract_hl7_messages_from_markdown(input_file)
+        )
+
+        successful = 0
+        failed = 0
+        files = [{"input_file": input_file, "results": []} for input_file in input_files]
+
+        tagged, to_convert = tee(tagged)
+        outcomes = HL7Converter.convert_messages(message for _, message in to_convert)
+        for (file_index, message), (json_data, error) in zip(tagged, outcomes):
+            results = files[file_index]["results"]
+            results.append(
+                HL7Converter._build_result(len(results) + 1, message, json_data, error, include_original)
+            )
+            if json_data:
+                successful += 1
+            else:
+                failed += 1
+
+        HL7Converter._write_json(files, output_file)
 
         return successful, failed
 
+    @staticmethod
+    def _build_result(message_index: int, message: str, json_data: Optional[Dict[str, Any]],
+                      error: Optional[str], include_original: bool = False) -> Dict[str, Any]:
+        """Build the output entry for one converted message."""
+        if json_data:
+            # Add metadata to help identify the message
+            return {
+                "message_index": message_index,
+                "conversion_status": "success",
+                "data": json_data
+            }
+        # Include error information for failed conversions
+        if include_original:
+            return {
+                "message_index": message_index,
+                "conversion_status": "failed",
+                "error": error,
+                "original_message": message
+            }
+        return {
+            "message_index": message_index,
+            "conversion_status": "failed",
+            "error": error,
+            "original_message_sha1": hashlib.sha1(message.encode('utf-8')).hexdigest(),
+            "original_message_prefix": message[:_ORIGINAL_PREFIX_LENGTH]
+        }
+
+    @staticmethod
+    def _write_json(results: Any, output_file: str) -> None:
+        """Write results to output_file as indented JSON, with orjson when it is installed."""
+        if orjson is not None:
+            with open(output_file, 'wb') as file:
+                file.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as file:
+                json.dump(results, file, indent=2)
+
 
 class HL7ConverterGUI(QMainWindow):
     """GUI for the HL7 to JSON Converter"""
@@ -240,16 +430,20 @@ class HL7ConverterGUI(QMainWindow):
             QMessageBox.critical(self, "Error", f"Input file '{self.input_file}' not found.")
             return
 
-        self.results_text.clear()
-        self.results_text.append(f"Processing {self.input_file}...")
+        # Collect the status lines and set them at once, so the text box lays out only once
+        lines = [f"Processing {self.input_file}..."]
 
         try:
             successful, failed = HL7Converter.process_file(self.input_file, self.output_file)
 
-            self.results_text.append(f"\nConversion complete:")
-            self.results_text.append(f"  - Successfully converted: {successful} messages")
-            self.results_text.append(f"  - Failed conversions: {failed} messages")
-            self.results_text.append(f"  - Output saved to: {self.output_file}")
+            lines += [
+                "",
+                "Conversion complete:",
+                f"  - Successfully converted: {successful} messages",
+                f"  - Failed conversions: {failed} messages",
+                f"  - Output saved to: {self.output_file}",
+            ]
+            self.results_text.setPlainText("\n".join(lines))
 
             if successful > 0:
                 QMessageBox.information(self, "Success", f"Conversion complete. {successful} messages converted successfully.")
@@ -257,7 +451,8 @@ class HL7ConverterGUI(QMainWindow):
                 QMessageBox.warning(self, "Warning", "No messages were converted successfully.")
 
         except Exception as e:
-            self.results_text.append(f"\nError during conversion: {str(e)}")
+            lines += ["", f"Error during conversion: {str(e)}"]
+            self.results_text.setPlainText("\n".join(lines))
             QMessageBox.critical(self, "Error", f"An error occurred during conversion: {str(e)}")
 
     def clear_results(self):
@@ -269,24 +464,36 @@ def main():
     """Main function to handle command line arguments or launch GUI"""
     # If command line arguments are provided, use CLI mode
     if len(sys.argv) > 1:
-        if len(sys.argv) < 3:
-            print(f"Usage: {sys.argv[0]} input_file output_file")
+        args = sys.argv[1:]
+        # --verbose keeps the full text of failed messages in the output
+        include_original = "--verbose" in args
+        args = [arg for arg in args if arg != "--verbose"]
+
+        if len(args) < 2:
+            print(f"Usage: {sys.argv[0]} [--verbose] input_file [input_file ...] output_file")
             sys.exit(1)
 
-        input_file = sys.argv[1]
-        output_file = sys.argv[2]
+        input_files = args[:-1]
+        output_file = args[-1]
 
-        if not os.path.exists(input_file):
-            print(f"Error: Input file '{input_file}' not found.")
-            sys.exit(1)
+        for input_file in input_files:
+            if not os.path.exists(input_file):
+                print(f"Error: Input file '{input_file}' not found.")
+                sys.exit(1)
 
-        print(f"Processing {input_file}...")
-        successful, failed = HL7Converter.process_file(input_file, output_file)
+        print(f"Processing {', '.join(input_files)}...")
+        if len(input_files) == 1:
+            successful, failed = HL7Converter.process_file(input_files[0], output_file, include_original)
+        else:
+            successful, failed = HL7Converter.process_files(input_files, output_file, include_original)
 
         print(f"Conversion complete:")
         print(f"  - Successfully converted: {successful} messages")
         print(f"  - Failed conversions: {failed} messages")
         print(f"  - Output saved to: {output_file}")
+        # Worker processes keep their own caches, so this only counts in-process conversions
+        cache_info = _convert_hl7_to_pickle.cache_info()
+        print(f"  - Parse cache: {cache_info.hits} hits, {cache_info.misses} misses")
     # Otherwise, launch the GUI
     else:
         app = QApplication(sys.argv)
@@ -1,7 +1,24 @@
+import importlib.util
+
 import pandas as pd
 
-# Read the Excel file
-df = pd.read_excel('phone_numbers.xlsx')
+
+def _summarize(col):
+    """
+    Summarize a column in one numeric-coercion pass.
+
+    Returns:
+        Tuple of (dtype, number of non-numeric values, sample of up to 10 non-numeric values)
+    """
+    non_numeric_mask = pd.to_numeric(col, errors='coerce').isna()
+    return col.dtype, int(non_numeric_mask.sum()), col[non_numeric_mask].head(10)
+
+
+# Read the Excel file, through the Rust calamine parser when python-calamine is installed
+if importlib.util.find_spec('python_calamine') is not None:
+    df = pd.read_excel('phone_numbers.xlsx', engine='calamine')
+else:
+    df = pd.read_excel('phone_numbers.xlsx')
 
 # Display the first few rows to understand the structure
 print("Excel file structure:")
@@ -16,32 +33,21 @@ print(df.dtypes)
 
 # If there's a column named "Phone Number", examine its content
 if "Phone Number" in df.columns:
+    column = df["Phone Number"]
     print("\nPhone Number column content:")
-    print(df["Phone Number"].head(10))
-    print("\nPhone Number column data type:", df["Phone Number"].dtype)
-    
-    # Check if all values in the Phone Number column are numeric
-    numeric_values = pd.to_numeric(df["Phone Number"], errors='coerce')
-    non_numeric_count = numeric_values.isna().sum()
+    print(column.head(10))
+    dtype, non_numeric_count, sample = _summarize(column)
+    print("\nPhone Number column data type:", dtype)
     print(f"\nNumber of non-numeric values in Phone Number column: {non_numeric_count}")
-    
-    if non_numeric_count > 0:
-        print("\nSample of non-numeric values:")
-        non_numeric_mask = numeric_values.isna()
-        print(df.loc[non_numeric_mask, "Phone Number"].head(10))
 else:
     # If there's no column named "Phone Number", check the first column (index 0)
-    first_column_name = df.columns[0]
-    print(f"\nFirst column '{first_column_name}' content:")
-    print(df.iloc[:, 0].head(10))
-    print(f"\nFirst column data type: {df.iloc[:, 0].dtype}")
-    
-    # Check if all values in the first column are numeric
-    numeric_values = pd.to_numeric(df.iloc[:, 0], errors='coerce')
-    non_numeric_count = numeric_values.isna().sum()
+    column = df.iloc[:, 0]
+    print(f"\nFirst column '{df.columns[0]}' content:")
+    print(column.head(10))
+    dtype, non_numeric_count, sample = _summarize(column)
+    print(f"\nFirst column data type: {dtype}")
     print(f"\nNumber of non-numeric values in first column: {non_numeric_count}")
-    
-    if non_numeric_count > 0:
-        print("\nSample of non-numeric values:")
-        non_numeric_mask = numeric_values.isna()
-        print(df.loc[non_numeric_mask, df.columns[0]].head(10))
\ No newline at end of file
+
+if non_numeric_count > 0:
+    print("\nSample of non-numeric values:")
+    print(sample)
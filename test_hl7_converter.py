@@ -7,6 +7,11 @@ import sys
 import json
 from main import HL7Converter
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard json module is used without it
+    orjson = None
+
 def main():
     """Test the HL7 to JSON converter with a sample message"""
     # Sample HL7 message from the MD file
@@ -27,7 +32,18 @@ OBX|5|CE|PREF_LANGUAG||Arabic||||||"""
         print(f"Error: {error}")
     else:
         print("\nFinal JSON output:")
-        print(json.dumps(json_data, indent=2))
+        if orjson is not None:
+            # Write the encoded bytes directly, skipping a decode and re-encode, unless stdout
+            # is text-only (e.g. redirected to io.StringIO)
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is not None:
+                sys.stdout.flush()
+                buffer.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2) + b"\n")
+                buffer.flush()
+            else:
+                print(orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(json.dumps(json_data, indent=2))
 
 if __name__ == "__main__":
     main()
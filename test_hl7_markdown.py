@@ -0,0 +1,195 @@
+import hashlib
+import json
+import re
+import sys
+import os
+import tempfile
+
+from hl7conv2 import Hl7Json
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Import functions from the script
+import main
+from main import HL7Converter, _iter_fenced_blocks
+
+# The fence regex that _iter_fenced_blocks replaced
+_FENCE_RE = re.compile(r'```\n(.*?)\n```', re.DOTALL)
+
+# Markdown inputs covering the edge cases of the fence scan
+_MARKDOWN_CASES = [
+    "",
+    "no fences here",
+    "```\nMSH|1\nOBX|1\n```",
+    "# Message\n```\nMSH|1\n```\ntext\n```\nMSH|2\n```\n",
+    "```\nMSH|1\n```\n```\nMSH|2\n```",  # Adjacent fences
+    "```\n\n```",  # Empty block
+    "```\nMSH|1\n```\n```\nunclosed",  # Unclosed fence
+    "```\nunclosed",
+    "``````\n```\nMSH|1\n```",
+    "```\n```\n```\n```",
+    "# Café\n```\nMSH|1\nOBX|1|TX|NOTE||café – 東京\n```\n",  # Non-ASCII, decoded as UTF-8 either way
+]
+
+def test_iter_fenced_blocks():
+    """Test that _iter_fenced_blocks finds exactly what the fence regex finds."""
+    for content in _MARKDOWN_CASES:
+        expected = _FENCE_RE.findall(content)
+
+        blocks = list(_iter_fenced_blocks(content))
+        assert blocks == expected, f"Expected {expected}, got {blocks} for {content!r}"
+
+        byte_blocks = list(_iter_fenced_blocks(content.encode('utf-8'), b'```\n', b'\n```'))
+        assert byte_blocks == [block.encode('utf-8') for block in expected], \
+            f"Expected {expected}, got {byte_blocks} for {content!r} as bytes"
+
+    print("All _iter_fenced_blocks tests passed!")
+
+def test_extract_hl7_messages_from_markdown():
+    """Test extracting messages from files, through mmap, text mode and the empty-file guard."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file = os.path.join(tmp_dir, "messages.md")
+        for content in _MARKDOWN_CASES:
+            # The CRLF version of each case is read in text mode, which turns '\r\n' into '\n'
+            for newline in ('\n', '\r\n'):
+                with open(input_file, 'w', encoding='utf-8', newline=newline) as file:
+                    file.write(content)
+
+                expected = _FENCE_RE.findall(content)
+                messages = list(HL7Converter.extract_hl7_messages_from_markdown(input_file))
+                assert messages == expected, \
+                    f"Expected {expected}, got {messages} for {content!r} with newline {newline!r}"
+
+    print("All extract_hl7_messages_from_markdown tests passed!")
+
+def test_process_files():
+    """Test converting several markdown files into one JSON file with per-file results."""
+    contents = [
+        "```\nMSH|^~\\&|A\nOBX|1|CE|X||a\n```\n```\nMSH|^~\\&|B\nPID|1\n```\n",
+        "",
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_files = []
+        for i, content in enumerate(contents):
+            input_file = os.path.join(tmp_dir, f"messages_{i}.md")
+            with open(input_file, 'w', encoding='utf-8') as file:
+                file.write(content)
+            input_files.append(input_file)
+        output_file = os.path.join(tmp_dir, "output.json")
+
+        successful, failed = HL7Converter.process_files(input_files, output_file)
+        with open(output_file, encoding='utf-8') as file:
+            output = json.load(file)
+
+    assert [entry["input_file"] for entry in output] == input_files, f"Unexpected files in {output}"
+    for entry, content in zip(output, contents):
+        results = entry["results"]
+        # Each file's messages are numbered from 1
+        assert [result["message_index"] for result in results] == list(range(1, len(_FENCE_RE.findall(content)) + 1)), \
+            f"Unexpected message numbering for {entry['input_file']}: {results}"
+
+    statuses = [result["conversion_status"] for entry in output for result in entry["results"]]
+    assert successful == statuses.count("success"), f"Expected {statuses.count('success')} successes, got {successful}"
+    assert failed == statuses.count("failed"), f"Expected {statuses.count('failed')} failures, got {failed}"
+    assert successful + failed == 2, f"Expected 2 messages in total, got {successful + failed}"
+    assert output[0]["results"][0]["data"]["OBX_segments"][0]["5"] == "a", f"Unexpected OBX data in {output}"
+
+    print("All process_files tests passed!")
+
+def test_failed_results():
+    """Test that failed results hold a hash and prefix of the message, or all of it on request."""
+    message = "MSH|é|" + "x" * 300
+
+    result = HL7Converter._build_result(1, message, None, "error")
+    assert "original_message" not in result, f"Unexpected full message in {result}"
+    assert result["original_message_sha1"] == hashlib.sha1(message.encode('utf-8')).hexdigest(), \
+        f"Unexpected hash in {result}"
+    assert result["original_message_prefix"] == message[:200], f"Unexpected prefix in {result}"
+
+    result = HL7Converter._build_result(1, message, None, "error", include_original=True)
+    assert result["original_message"] == message, f"Expected the full message in {result}"
+    assert "original_message_sha1" not in result, f"Unexpected hash in {result}"
+
+    # --verbose on the command line keeps the full message
+    saved_convert, saved_argv = main.convert_hl7_to_json, sys.argv
+    main.convert_hl7_to_json = lambda hl7_message: (None, "error")
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_file = os.path.join(tmp_dir, "messages.md")
+            output_file = os.path.join(tmp_dir, "output.json")
+            with open(input_file, 'w', encoding='utf-8') as file:
+                file.write(f"```\n{message}\n```\n")
+
+            for args, key in (([], "original_message_prefix"), (["--verbose"], "original_message")):
+                sys.argv = ["main.py", *args, input_file, output_file]
+                main.main()
+                with open(output_file, encoding='utf-8') as file:
+                    result = json.load(file)[0]
+                assert result["conversion_status"] == "failed", f"Expected a failed result, got {result}"
+                assert key in result, f"Expected {key} in {result} with arguments {args}"
+    finally:
+        main.convert_hl7_to_json, sys.argv = saved_convert, saved_argv
+
+    print("All failed result tests passed!")
+
+def test_obx_segments_match_hl7json():
+    """Test that converting only the OBX lines gives the OBX segments of the whole message."""
+    messages = [
+        "MSH|^~\\&|A\r\nPID|1\rOBX|1|CE|X||a\nOBX|2|CE|Y||b\r\n",  # Mixed line endings
+        "MSH|^~\\&|A\nOBX\nOBX|1",  # Bare OBX line
+        "MSH|^~\\&|A\n OBX|1|CE|X||a\nobx|2\nOBX |3",  # Not OBX segments
+        "MSH|^~\\&|A\nPID|1\nPV1|",  # No OBX lines
+        "MSH|^~\\&|A\nOBX|1|TX|X||a\\F\\b\\S\\c\\T\\d\\R\\e\\E\\f",  # Escapes
+        "MSH|^~\\&|A\nOBX|1|CE|X^Y~Z^W&V||a\n\n\rOBX|2\n\r\n",  # Repetitions and blank lines
+        "",
+        "OBX|1|CE|X||a",
+    ]
+
+    for message in messages:
+        expected = [segment for segment in Hl7Json(message).hl7_json if segment.get("segment_name") == "OBX"]
+        json_data, error = main._convert_hl7_to_json_uncached(message)
+        assert error is None, f"Unexpected error {error} for {message!r}"
+        assert json_data == {"OBX_segments": expected}, \
+            f"Expected {expected}, got {json_data['OBX_segments']} for {message!r}"
+
+    print("All OBX segment tests passed!")
+
+def test_cached_conversion_returns_copies():
+    """Test that repeated conversions hit the cache and can't see each other's mutations."""
+    message = "MSH|^~\\&|CACHE\nOBX|1|CE|X||a"
+
+    first, error = main.convert_hl7_to_json(message)
+    assert error is None, f"Unexpected error {error}"
+    expected = json.loads(json.dumps(first))
+    hits = main._convert_hl7_to_pickle.cache_info().hits
+
+    first["OBX_segments"][0]["5"] = "changed"
+    first["OBX_segments"].append({"segment_name": "OBX"})
+
+    second, error = main.convert_hl7_to_json(message)
+    assert error is None, f"Unexpected error {error}"
+    assert second == expected, f"Expected {expected}, got {second}"
+    assert main._convert_hl7_to_pickle.cache_info().hits == hits + 1, "Expected the second conversion to hit the cache"
+
+    print("All cached conversion tests passed!")
+
+if __name__ == "__main__":
+    print("Testing _iter_fenced_blocks function...")
+    test_iter_fenced_blocks()
+
+    print("\nTesting extract_hl7_messages_from_markdown function...")
+    test_extract_hl7_messages_from_markdown()
+
+    print("\nTesting process_files function...")
+    test_process_files()
+
+    print("\nTesting failed results...")
+    test_failed_results()
+
+    print("\nTesting OBX segment extraction...")
+    test_obx_segments_match_hl7json()
+
+    print("\nTesting cached conversions...")
+    test_cached_conversion_returns_copies()
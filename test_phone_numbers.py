@@ -2,12 +2,23 @@ import pandas as pd
 import re
 import sys
 import os
+import tempfile
 
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import functions from the script
-from excel_to_contacts import convert_excel_to_custom_csv, clean_phone_number
+import excel_to_contacts
+from excel_to_contacts import convert_excel_to_custom_csv, clean_phone_number, clean_phone_number_series
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; pandas' C parser reads the output without it
+    pa = pacsv = None
+
+# Optional '+' followed by digits only
+_PHONE_RE = re.compile(r'^\+?\d+$')
 
 def test_clean_phone_number():
     """Test the clean_phone_number function with various inputs."""
@@ -28,6 +39,43 @@ def test_clean_phone_number():
 
     print("All clean_phone_number tests passed!")
 
+def test_clean_phone_number_series():
+    """Test that the vectorized clean_phone_number_series matches clean_phone_number."""
+    phone_numbers = [
+        "+7999745-12-15", "+8210-7508-8471", "123-456-7890", "(123) 456-7890",
+        "(+1) 555", "12+34", "+", "", None, 1234567890,
+    ]
+
+    cleaned = clean_phone_number_series(pd.Series(phone_numbers, dtype=object))
+    expected = [clean_phone_number(phone_number) for phone_number in phone_numbers]
+    assert cleaned == expected, f"Expected {expected}, got {cleaned}"
+
+    print("All clean_phone_number_series tests passed!")
+
+def test_csv_writers_match():
+    """Test that the PyArrow and pure-Python CSV writers produce the same bytes."""
+    names = (["Huda", "Ali"], ["Sami", "Omar"], ["Khan", "Ahmed"])
+    phone_numbers = ["+123", "456"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        outputs = []
+        for use_pyarrow in (True, False):
+            output_file = os.path.join(tmp_dir, f"pyarrow_{use_pyarrow}.csv")
+            saved_pacsv = excel_to_contacts.pacsv
+            if not use_pyarrow:
+                excel_to_contacts.pacsv = None
+            try:
+                excel_to_contacts._write_csv(output_file, *names, phone_numbers)
+            finally:
+                excel_to_contacts.pacsv = saved_pacsv
+            with open(output_file, 'rb') as file:
+                outputs.append(file.read())
+
+    assert outputs[0] == outputs[1], f"CSV writers differ:\n{outputs[0]!r}\n{outputs[1]!r}"
+    assert outputs[1].splitlines()[1] == b"QTS,Huda,Sami,Khan,Huda,Khan,+123,Quadrate Tech Solutions,QTS,https://quadrate.lk"
+
+    print("Both CSV writers produce the same output!")
+
 def test_excel_processing():
     """Test processing the Excel file and check the output CSV."""
     input_file = "phone_numbers.xlsx"
@@ -38,18 +86,21 @@ def test_excel_processing():
     convert_excel_to_custom_csv(input_file, phone_column, output_file)
 
     # Read the output CSV, ensuring phone numbers are read as strings
-    df_output = pd.read_csv(output_file, dtype={"Phone 1 - Value": str})
+    # (pandas' pyarrow engine applies dtype only after inferring numbers, so call pyarrow directly)
+    if pacsv is not None:
+        convert_options = pacsv.ConvertOptions(column_types={"Phone 1 - Value": pa.string()})
+        df_output = pacsv.read_csv(output_file, convert_options=convert_options).to_pandas()
+    else:
+        df_output = pd.read_csv(output_file, dtype={"Phone 1 - Value": str})
 
     # Check if the "Phone 1 - Value" column exists
     assert "Phone 1 - Value" in df_output.columns, "Output CSV doesn't have 'Phone 1 - Value' column"
 
     # Check if all phone numbers are properly formatted (only digits and possibly a leading '+')
-    for phone in df_output["Phone 1 - Value"]:
-        # Convert to string if it's not already
-        phone_str = str(phone)
-
-        # Phone should match the pattern: optional '+' followed by digits only
-        assert re.match(r'^\+?\d+$', phone_str), f"Phone number {phone_str} is not properly formatted"
+    # Phone should match the pattern: optional '+' followed by digits only
+    phones = df_output["Phone 1 - Value"].astype(str)
+    bad = ~phones.str.match(_PHONE_RE)
+    assert not bad.any(), f"Phone numbers {phones[bad].tolist()} are not properly formatted"
 
     print(f"All phone numbers in the output CSV are properly formatted!")
 
@@ -60,6 +111,12 @@ if __name__ == "__main__":
     print("Testing clean_phone_number function...")
     test_clean_phone_number()
 
+    print("\nTesting clean_phone_number_series function...")
+    test_clean_phone_number_series()
+
+    print("\nTesting CSV writers...")
+    test_csv_writers_match()
+
     print("\nTesting Excel processing...")
     df_output = test_excel_processing()
 